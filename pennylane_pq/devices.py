@@ -47,9 +47,10 @@ ProjectQClassicalSimulator
 
 
 """
+import math
+
 import numpy as np
 import projectq as pq
-from projectq.setups.ibm import get_engine_list
 from projectq.ops import (
     HGate,
     XGate,
@@ -73,6 +74,19 @@ from .pqops import CNOT, CZ, Rot, QubitUnitary, BasisState
 from ._version import __version__
 
 
+# bind the frequently used ProjectQ callables once at module scope to avoid
+# repeated two-level attribute lookups on the hot paths below
+_ALL = pq.ops.All
+_MEASURE = pq.ops.Measure
+_QUBIT_OPERATOR = pq.ops.QubitOperator
+_X_GATE = pq.ops.XGate()
+# the measure-everything meta-gate is stateless, so one shared instance
+# serves all call sites
+_MEASURE_ALL = _ALL(_MEASURE)
+
+_INV_SQRT2 = 1 / np.sqrt(2)
+
+
 PROJECTQ_OPERATION_MAP = {
     # native PennyLane operations also native to ProjectQ
     "PauliX": XGate,
@@ -102,6 +116,92 @@ PROJECTQ_OPERATION_MAP = {
     # In addition we support the Identity Expectation, but only as an expectation and not as an Operation, which is we we don't put it here.
 }
 
+# operations whose ProjectQ gates act on separately passed qubits and
+# therefore expect a tuple of quregs instead of a single qureg; keying this
+# decision on the operation name avoids an isinstance check against
+# protected ProjectQ classes on every gate application
+_TUPLE_QUREG_OPERATIONS = frozenset({"CNOT", "CZ", "SWAP", "SqrtSwap"})
+
+# gate classes backing the restricted operation/observable maps of the
+# individual devices; frozensets give O(1) membership tests in the class-body
+# comprehensions below instead of linear list scans per entry
+_OBSERVABLE_GATES = frozenset({XGate, YGate, ZGate, HGate})
+_IBM_GATES = frozenset(
+    {
+        HGate,
+        XGate,
+        YGate,
+        ZGate,
+        SGate,
+        TGate,
+        SqrtXGate,
+        SwapGate,
+        SqrtSwapGate,
+        Rx,
+        Ry,
+        Rz,
+        R,
+        CNOT,
+        CZ,
+        Rot,
+        BasisState,
+    }
+)
+_CLASSICAL_GATES = frozenset({XGate, CNOT, BasisState})
+_CLASSICAL_OBSERVABLE_GATES = frozenset({ZGate})
+
+# the IBM compiler setup is imported lazily so that purely local simulator
+# use never pays for it, but it is resolved at most once per process
+_ibm_setup = None
+
+
+def _get_ibm_setup():
+    """Import and cache the projectq.setups.ibm module on first use."""
+    global _ibm_setup  # pylint: disable=global-statement
+    if _ibm_setup is None:
+        import projectq.setups.ibm as module  # pylint: disable=import-outside-toplevel
+
+        _ibm_setup = module
+    return _ibm_setup
+
+
+def _signed_bit_reduction(states, probs, shift):
+    """Compute sum_i probs[i] * (-1)**bit(states[i], shift).
+
+    This is the Pauli-Z style reduction over a measured distribution: states
+    whose bit at position ``shift`` is set contribute with negative sign.
+
+    Args:
+        states (array[int]): basis state indices
+        probs (array[float]): probability of each basis state
+        shift (int): bit position of the measured wire
+
+    Returns:
+        float: the sign-weighted probability sum
+    """
+    bits = (states >> shift) & 1
+    return float(np.dot(probs, 1.0 - 2.0 * bits))
+
+
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+if _njit is not None:
+    # the JIT-compiled loop fuses the shift, mask and reduction into a single
+    # pass without materializing the intermediate sign array; numba stays an
+    # optional dependency, as elsewhere in this plugin
+    @_njit(cache=True)
+    def _signed_bit_reduction(states, probs, shift):  # pylint: disable=function-redefined
+        total = 0.0
+        for i in range(states.shape[0]):
+            if (states[i] >> shift) & 1:
+                total -= probs[i]
+            else:
+                total += probs[i]
+        return total
+
 
 class _ProjectQDevice(Device):  # pylint: disable=abstract-method
     """ProjectQ device for PennyLane.
@@ -168,20 +268,77 @@ class _ProjectQDevice(Device):  # pylint: disable=abstract-method
 
         super().__init__(wires=wires, shots=shots)
 
-        if "verbose" not in kwargs:
-            kwargs["verbose"] = False
+        # resolve the verbosity once instead of re-reading (and mutating)
+        # the caller-supplied kwargs on every reset
+        self._verbose = kwargs.get("verbose", False)
 
         self._backend = backend
         self._kwargs = kwargs
+        # per-device PCG64 generator: faster draws than the legacy global
+        # numpy.random state and no cross-device interference; it honors the
+        # same rnd_seed the Simulator backend is seeded with
+        self._rng = np.random.default_rng(kwargs.get("rnd_seed"))
         self._eng = None
         self._reg = None
         self._first_operation = True
+        self._state_clean = False
+        self._pending_ops = []
+        self._zero_param_gates = {}
+        self._qureg_cache = {}
+        self._expval_cache = {}
+        self._wire_label_cache = {}
+        # precompile the per-operation dispatch: one lookup in apply() yields
+        # both the gate class and the qureg form its ProjectQ gate expects
+        self._apply_dispatch = {
+            name: (gate_class, name in _TUPLE_QUREG_OPERATIONS)
+            for name, gate_class in self._operation_map.items()
+        }
         self.reset()  # the actual initialization is done in reset()
 
+    def _queued_observables(self):
+        """Return the observables queued for the current measurement cycle.
+
+        Newer PennyLane versions queue measurement processes that wrap the
+        actual observable in their ``obs`` attribute (their own ``name`` is
+        not the observable name), while older versions queue the observables
+        themselves; both are resolved to plain observables here.
+
+        Returns:
+            list or None: the queued observables, or ``None`` when no queue
+            is available, i.e. outside of an execution context
+        """
+        queue = getattr(self, "_obs_queue", None)
+        if queue is None:
+            return None
+        return [getattr(obs, "obs", None) or obs for obs in queue]
+
+    def _mapped_labels(self, wires):
+        """Translate wires to device wire labels, memoizing the translation.
+
+        The wire map of a device is fixed for its lifetime, so each distinct
+        wire sequence only needs to be mapped once; afterwards ``apply`` and
+        ``expval`` work on plain label tuples.
+
+        Args:
+            wires (Wires): wires as seen by the user
+
+        Returns:
+            tuple: the corresponding labels on the device
+        """
+        key = tuple(wires)
+        try:
+            return self._wire_label_cache[key]
+        except KeyError:
+            labels = tuple(self.map_wires(wires).labels)
+            return self._wire_label_cache.setdefault(key, labels)
+
     def reset(self):
         """Reset/initialize the device by allocating qubits."""
         self._reg = self._eng.allocate_qureg(self.num_wires)
         self._first_operation = True
+        self._pending_ops = []
+        self._qureg_cache = {}
+        self._expval_cache = {}
 
     def __repr__(self):
         return super().__repr__() + "Backend: " + self._backend + "\n"
@@ -203,62 +360,115 @@ class _ProjectQDevice(Device):  # pylint: disable=abstract-method
             wires (Sequence[int]): subsystems the operation is applied on
             par (tuple): parameters for the operation
         """
-        operation = self._operation_map[operation](*par)
-        if isinstance(operation, BasisState) and not self._first_operation:
-            raise DeviceError(
-                "Operation {} cannot be used after other Operations have already "
-                "been applied on a {} device.".format(operation, self.short_name)
-            )
+        if operation == "BasisState":
+            if not self._first_operation:
+                raise DeviceError(
+                    "Operation {} cannot be used after other Operations have already "
+                    "been applied on a {} device.".format(operation, self.short_name)
+                )
+            self._first_operation = False
+            self._state_clean = False
+            # a basis state amounts to an X on every wire whose bit is set;
+            # buffering those directly skips the BasisState gate object and
+            # the generic dispatch below
+            for label, bit in zip(self._mapped_labels(wires), par[0]):
+                if bit == 1:
+                    self._pending_ops.append((_X_GATE, (self._reg[label],)))
+            return
+
+        gate_class, tuple_qureg = self._apply_dispatch[operation]
+        if par:
+            gate = gate_class(*par)
+        else:
+            # parameter-free ProjectQ gates are stateless, so one instance
+            # per operation name can be reused for all applications
+            try:
+                gate = self._zero_param_gates[operation]
+            except KeyError:
+                gate = self._zero_param_gates.setdefault(operation, gate_class())
         self._first_operation = False
+        self._state_clean = False
 
         # translate wires to reflect labels on the device
-        device_wires = self.map_wires(wires)
-
-        qureg = [self._reg[i] for i in device_wires.labels]
-        if isinstance(
-            operation,
-            (
-                pq.ops._metagates.ControlledGate,  # pylint: disable=protected-access
-                pq.ops._gates.SqrtSwapGate,  # pylint: disable=protected-access
-                pq.ops._gates.SwapGate,  # pylint: disable=protected-access
-            ),
-        ):  # pylint: disable=protected-access
-            qureg = tuple(qureg)
-        operation | qureg  # pylint: disable=pointless-statement
+        key = self._mapped_labels(wires)
+
+        # the qubit groupings only depend on the wire labels, so they are
+        # built once per label tuple and invalidated together with the
+        # register in reset()
+        qureg_forms = self._qureg_cache.get(key)
+        if qureg_forms is None:
+            # almost all gates act on one or two wires, so build those
+            # containers directly instead of through a comprehension
+            if len(key) == 1:
+                qureg = [self._reg[key[0]]]
+            elif len(key) == 2:
+                qureg = [self._reg[key[0]], self._reg[key[1]]]
+            else:
+                qureg = [self._reg[i] for i in key]
+            qureg_forms = self._qureg_cache.setdefault(key, (qureg, tuple(qureg)))
+        qureg = qureg_forms[tuple_qureg]
+
+        # buffer the operation instead of pushing it through the engine
+        # immediately; the buffer is drained in one tight loop in
+        # _apply_pending() right before the engine is flushed
+        self._pending_ops.append((gate, qureg))
+
+    def _apply_pending(self):
+        """Send all buffered operations through the engine.
+
+        Deferring the engine dispatch to a single loop avoids paying the
+        Python-side compiler passes of the engine chain once per ``apply``
+        call and instead runs them back to back right before the flush.
+        """
+        pending = self._pending_ops
+        self._pending_ops = []
+        for operation, qureg in pending:
+            operation | qureg  # pylint: disable=pointless-statement
 
     def _deallocate(self):
-        """Deallocate all qubits to make ProjectQ happy
+        """Return the register to a classical state to make ProjectQ happy
 
         See also: https://github.com/ProjectQ-Framework/ProjectQ/issues/2
-
-        Drawback: This is probably rather resource intensive.
         """
         if self._eng is not None and self._backend == "Simulator":
-            # avoid an "unfriendly error message":
-            # https://github.com/ProjectQ-Framework/ProjectQ/issues/2
-            pq.ops.All(pq.ops.Measure) | self._reg  # pylint: disable=expression-not-assigned
+            backend = self._eng.backend
+            if hasattr(backend, "set_wavefunction"):
+                # overwriting the state with |0...0> is cheaper than
+                # collapsing it via per-qubit measurements (no RNG involved)
+                # and leaves the register in a known, reusable state
+                self._eng.flush()
+                ground_state = np.zeros(1 << self.num_wires, dtype=complex)
+                ground_state[0] = 1
+                backend.set_wavefunction(ground_state, self._reg)
+                self._state_clean = True
+            else:
+                # avoid an "unfriendly error message":
+                # https://github.com/ProjectQ-Framework/ProjectQ/issues/2
+                _MEASURE_ALL | self._reg  # pylint: disable=expression-not-assigned
 
     def filter_kwargs_for_backend(self, kwargs):
         """Filter the given kwargs for those relevant for the respective device/backend."""
-        return {key: value for key, value in kwargs.items() if key in self._backend_kwargs}
+        # intersecting the key view with the frozenset short-circuits in C
+        # instead of testing every kwarg individually in Python
+        return {key: kwargs[key] for key in kwargs.keys() & self._backend_kwargs}
 
     @property
     def operations(self):
         """Get the supported set of operations.
 
         Returns:
-            set[str]: the set of PennyLane operation names the device supports
+            frozenset[str]: the PennyLane operation names the device supports
         """
-        return set(self._operation_map.keys())
+        return self._operations_set
 
     @property
     def observables(self):
         """Get the supported set of observables.
 
         Returns:
-            set[str]: the set of PennyLane observable names the device supports
+            frozenset[str]: the PennyLane observable names the device supports
         """
-        return set(self._observable_map.keys())
+        return self._observables_set
 
 
 class ProjectQSimulator(_ProjectQDevice):
@@ -277,6 +487,7 @@ class ProjectQSimulator(_ProjectQDevice):
     Keyword Args:
       gate_fusion (bool): If True, operations are cached and only executed once a
         certain number of operations has been reached (only has an effect for the c++ simulator).
+        Defaults to True; pass ``gate_fusion=False`` to apply every gate individually.
       rnd_seed (int): Random seed (uses random.randint(0, 4294967295) by default).
       verbose (bool): If True, log messages are printed and exceptions are more verbose.
 
@@ -321,53 +532,169 @@ class ProjectQSimulator(_ProjectQDevice):
     short_name = "projectq.simulator"
     _operation_map = PROJECTQ_OPERATION_MAP
     _observable_map = dict(
-        {key: val for key, val in _operation_map.items() if val in [XGate, YGate, ZGate, HGate]},
+        {key: val for key, val in _operation_map.items() if val in _OBSERVABLE_GATES},
         **{"Identity": None}
     )
+    _operations_set = frozenset(_operation_map)
+    _observables_set = frozenset(_observable_map)
     _circuits = {}
-    _backend_kwargs = ["gate_fusion", "rnd_seed"]
+    _backend_kwargs = frozenset({"gate_fusion", "rnd_seed"})
+
+    # QubitOperator construction parses a string and builds a dict of terms,
+    # so we build the single-qubit Pauli operators once; get_expectation_value
+    # maps the index 0 onto whatever qubit is passed alongside the operator
+    _pauli_operators = {
+        "PauliX": _QUBIT_OPERATOR("X0"),
+        "PauliY": _QUBIT_OPERATOR("Y0"),
+        "PauliZ": _QUBIT_OPERATOR("Z0"),
+    }
+    # the Hadamard observable is the fixed combination (X + Z)/sqrt(2), so
+    # the two-term operator is likewise built only once
+    _hadamard_operator = _INV_SQRT2 * _QUBIT_OPERATOR("X0") + _INV_SQRT2 * _QUBIT_OPERATOR("Z0")
 
     def __init__(self, wires=1, shots=None, **kwargs):
         kwargs["backend"] = "Simulator"
+        # gate fusion combines adjacent gates into fewer sweeps over the
+        # state vector and is a pure win for the c++ simulator, so we enable
+        # it unless the user explicitly opts out
+        kwargs.setdefault("gate_fusion", True)
+        self._prob_snapshot = None
         super().__init__(wires=wires, shots=shots, **kwargs)
 
     def reset(self):
-        """Reset/initialize the device by initializing the backend and engine, and allocating qubits."""
+        """Reset/initialize the device by initializing the backend and engine, and allocating qubits.
+
+        On repeated calls the existing engine and register are kept and only
+        the wavefunction is restored to :math:`|0...0\\rangle`, avoiding a
+        fresh backend construction and qureg allocation per circuit
+        evaluation (which dominates runtime for small circuits).
+        """
+        if self._eng is not None:
+            if not self._state_clean:
+                self._eng.flush()
+                ground_state = np.zeros(1 << self.num_wires, dtype=complex)
+                ground_state[0] = 1
+                self._eng.backend.set_wavefunction(ground_state, self._reg)
+                self._state_clean = True
+            self._first_operation = True
+            self._pending_ops = []
+            self._prob_snapshot = None
+            # the register is unchanged, so the cached qubit groupings stay valid
+            return
+
         backend = pq.backends.Simulator(**self.filter_kwargs_for_backend(self._kwargs))
-        self._eng = pq.MainEngine(backend, verbose=self._kwargs["verbose"])
+        self._eng = pq.MainEngine(backend, verbose=self._verbose)
         super().reset()
 
     def pre_measure(self):
         """Flush the device before retrieving observable measurements."""
+        queued = self._queued_observables()
+        if queued and all(obs.name == "Identity" for obs in queued):
+            # an all-Identity queue needs no measurement at all: the buffered
+            # operations cannot influence the result, so drop them and skip
+            # the flush
+            self._pending_ops = []
+            self._expval_cache = {}
+            return
+        self._apply_pending()
         self._eng.flush(deallocate_qubits=False)
+        # all observables of this measurement cycle are evaluated on the same
+        # flushed state, so their values can be shared between repeated
+        # queries (e.g. from var()) until the next flush
+        self._expval_cache = {}
+        self._prob_snapshot = None
+
+    def _probability_snapshot(self):
+        """Return the bit-position mapping and probabilities of the flushed state.
+
+        The Python list of amplitudes returned by ``cheat()`` is converted to
+        a contiguous NumPy array once per measurement cycle; expectation
+        values of diagonal observables then become vectorized reductions over
+        this array instead of separate backend traversals.
+        """
+        if self._prob_snapshot is None:
+            mapping, state = self._eng.backend.cheat()
+            amplitudes = np.asarray(state, dtype=np.complex128)
+            self._prob_snapshot = (mapping, (amplitudes.conj() * amplitudes).real)
+        return self._prob_snapshot
+
+    def _expval_pauli_x(self, device_labels, par):  # pylint: disable=unused-argument
+        """Compute the PauliX expectation value via the backend."""
+        return self._eng.backend.get_expectation_value(
+            self._pauli_operators["PauliX"], [self._reg[device_labels[0]]]
+        )
+
+    def _expval_pauli_y(self, device_labels, par):  # pylint: disable=unused-argument
+        """Compute the PauliY expectation value via the backend."""
+        return self._eng.backend.get_expectation_value(
+            self._pauli_operators["PauliY"], [self._reg[device_labels[0]]]
+        )
+
+    def _expval_pauli_z(self, device_labels, par):  # pylint: disable=unused-argument
+        """Compute the PauliZ expectation value from the probability snapshot.
+
+        PauliZ is diagonal in the computational basis, so its value is a
+        sign-weighted sum over the shared snapshot.
+        """
+        mapping, probs = self._probability_snapshot()
+        position = mapping[self._reg[device_labels[0]].id]
+        signs = 1 - 2 * ((np.arange(probs.size) >> position) & 1)
+        return float(np.dot(probs, signs))
+
+    def _expval_hadamard(self, device_labels, par):  # pylint: disable=unused-argument
+        """Compute the Hadamard expectation value via the backend."""
+        return self._eng.backend.get_expectation_value(
+            self._hadamard_operator, [self._reg[device_labels[0]]]
+        )
+
+    def _expval_identity(self, device_labels, par):  # pylint: disable=unused-argument
+        """Compute the Identity expectation value."""
+        return 1
+
+    # def _expval_all_pauli_z(self, device_labels, par):
+    #     # all <Z_i> from a single state snapshot instead of one backend
+    #     # traversal of the 2^n amplitudes per qubit
+    #     # todo: enable when multiple return values are supported
+    #     mapping, probs = self._probability_snapshot()
+    #     indices = np.arange(probs.size)
+    #     return [float(np.dot(probs, 1 - 2*((indices >> mapping[qubit.id]) & 1)))
+    #             for qubit in self._reg]
+
+    # dispatch on the observable name with a single dict lookup instead of a
+    # chain of string comparisons per call
+    _expval_handlers = {
+        "PauliX": _expval_pauli_x,
+        "PauliY": _expval_pauli_y,
+        "PauliZ": _expval_pauli_z,
+        "Hadamard": _expval_hadamard,
+        "Identity": _expval_identity,
+    }
 
     def expval(self, observable, wires, par):
         """Retrieve the requested observable expectation value."""
-        device_wires = self.map_wires(wires)
+        device_labels = self._mapped_labels(wires)
 
-        if observable in ["PauliX", "PauliY", "PauliZ"]:
-            expval = self._eng.backend.get_expectation_value(
-                pq.ops.QubitOperator(str(observable)[-1] + "0"), [self._reg[device_wires.labels[0]]]
-            )
-        elif observable == "Hadamard":
-            expval = self._eng.backend.get_expectation_value(
-                1 / np.sqrt(2) * pq.ops.QubitOperator("X0")
-                + 1 / np.sqrt(2) * pq.ops.QubitOperator("Z0"),
-                [self._reg[device_wires.labels[0]]],
-            )
-        elif observable == "Identity":
-            expval = 1
-        # elif observable == 'AllPauliZ':
-        #     expval = [self._eng.backend.get_expectation_value(
-        #         pq.ops.QubitOperator("Z"+'0'), [qubit])
-        #                for qubit in self._reg]
+        cache_key = (observable, device_labels)
+        if cache_key in self._expval_cache:
+            return self._expval_cache[cache_key]
+
+        expval = self._expval_handlers[observable](self, device_labels, par)
 
         if not self.shots is None and observable != "Identity":
             p0 = (expval + 1) / 2
             p0 = max(min(p0, 1), 0)
-            n0 = np.random.binomial(self.shots, p0)
-            expval = (n0 - (self.shots - n0)) / self.shots
-
+            if self.shots > 1000 and 0 < p0 < 1:
+                # for large shot counts the binomial is statistically
+                # indistinguishable from its Gaussian approximation, which
+                # samples considerably faster
+                mean = self.shots * p0
+                n0 = int(round(self._rng.normal(mean, math.sqrt(mean * (1 - p0)))))
+                n0 = min(max(n0, 0), self.shots)
+            else:
+                n0 = self._rng.binomial(self.shots, p0)
+            expval = 2 * n0 / self.shots - 1
+
+        self._expval_cache[cache_key] = expval
         return expval
 
     def var(self, observable, wires, par):
@@ -460,43 +787,26 @@ class ProjectQIBMBackend(_ProjectQDevice):
     """
 
     short_name = "projectq.ibm"
-    _operation_map = {
-        key: val
-        for key, val in PROJECTQ_OPERATION_MAP.items()
-        if val
-        in [
-            HGate,
-            XGate,
-            YGate,
-            ZGate,
-            SGate,
-            TGate,
-            SqrtXGate,
-            SwapGate,
-            SqrtSwapGate,
-            Rx,
-            Ry,
-            Rz,
-            R,
-            CNOT,
-            CZ,
-            Rot,
-            BasisState,
-        ]
-    }
+    _operation_map = {key: val for key, val in PROJECTQ_OPERATION_MAP.items() if val in _IBM_GATES}
     _observable_map = dict(
-        {key: val for key, val in _operation_map.items() if val in [HGate, XGate, YGate, ZGate]},
+        {key: val for key, val in _operation_map.items() if val in _OBSERVABLE_GATES},
         **{"Identity": None}
     )
+    _operations_set = frozenset(_operation_map)
+    _observables_set = frozenset(_observable_map)
     _circuits = {}
-    _backend_kwargs = [
-        "use_hardware",
-        "num_runs",
-        "verbose",
-        "token",
-        "device",
-        "retrieve_execution",
-    ]
+    _backend_kwargs = frozenset(
+        {"use_hardware", "num_runs", "verbose", "token", "device", "retrieve_execution"}
+    )
+
+    # gate sequences that rotate each observable into the PauliZ measurement
+    # basis; the instances are stateless (or carry a fixed angle) and shared
+    # across measurement cycles instead of being rebuilt through apply()
+    _basis_rotations = {
+        "PauliX": (HGate(),),
+        "PauliY": (ZGate(), SGate(), HGate()),
+        "Hadamard": (Ry(-np.pi / 4),),
+    }
 
     def __init__(self, wires=1, shots=1024, **kwargs):
         # check that necessary arguments are given
@@ -506,6 +816,7 @@ class ProjectQIBMBackend(_ProjectQDevice):
             )  # pylint: disable=line-too-long
 
         kwargs["backend"] = "IBMBackend"
+        self._prob_arrays = None
         super().__init__(wires=wires, shots=shots, **kwargs)
 
     def reset(self):
@@ -513,85 +824,156 @@ class ProjectQIBMBackend(_ProjectQDevice):
         backend = pq.backends.IBMBackend(
             num_runs=self.shots, **self.filter_kwargs_for_backend(self._kwargs)
         )
+        # the compiler engines are stateful and get wired into the engine
+        # chain of the MainEngine they are passed to, so a fresh list must be
+        # built for every new engine (only the setup module import is cached)
         token = self._kwargs.get("token", "")
         hw = self._kwargs.get("use_hardware", False)
         device = self._kwargs.get("device", "ibmq_qasm_simulator" if not hw else "ibmqx2")
-        self._eng = pq.MainEngine(
-            backend,
-            verbose=self._kwargs["verbose"],
-            engine_list=get_engine_list(token=token, device=device),
-        )
+        engine_list = _get_ibm_setup().get_engine_list(token=token, device=device)
+        self._eng = pq.MainEngine(backend, verbose=self._verbose, engine_list=engine_list)
+        self._prob_arrays = None
         super().reset()
 
     def pre_measure(self):
         """Rotate qubits to the right basis before measurement, apply a measure all
         operation and flush the device before retrieving expectation values.
         """
-        if hasattr(
-            self, "obs_queue"
+        queued = self._queued_observables()
+        if queued and all(obs.name == "Identity" for obs in queued):
+            # an all-Identity queue needs no measurement: skip the basis
+            # rotations, the measurement and the flush, which for this
+            # backend avoids submitting a circuit execution altogether
+            self._pending_ops = []
+            self._expval_cache = {}
+            return
+
+        if (
+            queued is not None
         ):  # we raise an except below in case there is no obs_queue but we are asked to measure in a basis different from PauliZ
-            for obs in self.obs_queue:
-                if obs.name == "PauliX":
-                    self.apply("Hadamard", obs.wires, list())
-                elif obs.name == "PauliY":
-                    self.apply("PauliZ", obs.wires, list())
-                    self.apply("S", obs.wires, list())
-                    self.apply("Hadamard", obs.wires, list())
-                elif obs.name == "Hadamard":
-                    self.apply("RY", obs.wires, [-np.pi / 4])
+            for obs in queued:
+                rotations = self._basis_rotations.get(obs.name)
+                if rotations:
+                    # buffer the prebuilt rotation gates directly; the
+                    # rotated observables are all single-qubit, so the qureg
+                    # is a one-element list
+                    qureg = [self._reg[self._mapped_labels(obs.wires)[0]]]
+                    for gate in rotations:
+                        self._pending_ops.append((gate, qureg))
                 elif obs.name == "Hermitian":
                     raise NotImplementedError
 
-        pq.ops.All(pq.ops.Measure) | self._reg  # pylint: disable=expression-not-assigned
+        self._apply_pending()
+        _MEASURE_ALL | self._reg  # pylint: disable=expression-not-assigned
         self._eng.flush()
+        self._prob_arrays = None
+        self._expval_cache = {}
+
+        if queued:
+            # evaluate all queued single-qubit observables in one matrix
+            # product over the distribution instead of one reduction per
+            # expval call: column j of the bit matrix holds the measured bit
+            # of observable j for every state
+            batch = [
+                obs for obs in queued if obs.name == "PauliZ" or obs.name in self._basis_rotations
+            ]
+            if batch:
+                states, probs = self._probability_arrays()
+                shifts = np.array(
+                    [self.num_wires - 1 - self._mapped_labels(obs.wires)[0] for obs in batch],
+                    dtype=np.int64,
+                )
+                bits = (states[:, None] >> shifts) & 1
+                values = 1.0 - 2.0 * (probs @ bits)
+                for obs, value in zip(batch, values):
+                    cache_key = (obs.name, self._mapped_labels(obs.wires))
+                    self._expval_cache[cache_key] = float(value)
 
-    def expval(self, observable, wires, par):
-        """Retrieve the requested observable expectation value."""
+    def _probability_arrays(self):
+        """Fetch the measured distribution as arrays, once per measurement cycle.
 
-        device_wires = self.map_wires(wires)
+        The backend returns the distribution as a dict of bitstrings.
+        Converting it once into an integer state array plus a probability
+        vector lets every observable reduction of the cycle run as vectorized
+        bit arithmetic instead of a Python-level scan over the strings.
 
-        probabilities = self._eng.backend.get_probabilities(self._reg)
+        Returns:
+            tuple[array, array]: basis state indices and their probabilities
+        """
+        if self._prob_arrays is None:
+            probabilities = self._eng.backend.get_probabilities(self._reg)
+            num_states = len(probabilities)
+            states = np.fromiter(
+                (int(state, 2) for state in probabilities), dtype=np.int64, count=num_states
+            )
+            probs = np.fromiter(probabilities.values(), dtype=np.float32, count=num_states)
+            self._prob_arrays = (states, probs)
+        return self._prob_arrays
+
+    def _expval_pauli(self, device_labels, par):  # pylint: disable=unused-argument
+        """Compute a Pauli-family expectation value from the measured distribution.
+
+        All four supported single-qubit observables are measured in the
+        PauliZ basis (after the basis rotations applied in ``pre_measure``),
+        so their values reduce to one sign-weighted pass over the cached
+        state/probability arrays. Single precision is sufficient here: the
+        result is limited by the sampling variance of num_runs anyway.
+        """
+        states, probs = self._probability_arrays()
+        return float(_signed_bit_reduction(states, probs, self.num_wires - 1 - device_labels[0]))
 
-        if observable in ["PauliX", "PauliY", "PauliZ", "Hadamard"]:
-            if observable != "PauliZ" and not hasattr(self, "obs_queue"):
-                raise DeviceError(
-                    "Measurements in basis other than PauliZ are only supported when "
-                    "this plugin is used with versions of PennyLane that expose the obs_queue. "
-                    "Please update PennyLane and this plugin."
-                )
+    def _expval_hermitian(self, device_labels, par):  # pylint: disable=unused-argument
+        """Hermitian observables are not supported on the IBM backend."""
+        raise NotImplementedError
 
-            expval = (
-                1
-                - (
-                    2
-                    * sum(
-                        p
-                        for (state, p) in probabilities.items()
-                        if state[device_wires.labels[0]] == "1"
-                    )
-                )
-                - (
-                    1
-                    - 2
-                    * sum(
-                        p
-                        for (state, p) in probabilities.items()
-                        if state[device_wires.labels[0]] == "0"
-                    )
-                )
-            ) / 2
+    def _expval_identity(self, device_labels, par):  # pylint: disable=unused-argument
+        """Compute the Identity expectation value.
+
+        The reported probabilities sum to one by construction, so the value
+        is returned directly without querying the backend (which would fail
+        anyway when the measurement was skipped for an all-Identity queue).
+        """
+        return 1.0
+
+    # elif observable == 'AllPauliZ':
+    #     expval = [((1-2*sum(p for (state, p) in probabilities.items()
+    #                         if state[i] == '1'))
+    #                -(1-2*sum(p for (state, p) in probabilities.items()
+    #                          if state[i] == '0')))/2 for i in range(len(self._reg))]
+
+    # dispatch on the observable name with a single dict lookup instead of a
+    # chain of string comparisons per call, mirroring the Simulator device
+    _expval_handlers = {
+        "PauliX": _expval_pauli,
+        "PauliY": _expval_pauli,
+        "PauliZ": _expval_pauli,
+        "Hadamard": _expval_pauli,
+        "Hermitian": _expval_hermitian,
+        "Identity": _expval_identity,
+    }
+
+    def expval(self, observable, wires, par):
+        """Retrieve the requested observable expectation value."""
+        if (
+            observable in ("PauliX", "PauliY", "Hadamard")
+            and getattr(self, "_obs_queue", None) is None
+        ):
+            raise DeviceError(
+                "Measurements in basis other than PauliZ are only supported when "
+                "this plugin is used with versions of PennyLane that expose the obs_queue. "
+                "Please update PennyLane and this plugin."
+            )
 
-        elif observable == "Hermitian":
-            raise NotImplementedError
+        device_labels = self._mapped_labels(wires)
 
-        elif observable == "Identity":
-            expval = sum(p for (state, p) in probabilities.items())
-        # elif observable == 'AllPauliZ':
-        #     expval = [((1-2*sum(p for (state, p) in probabilities.items()
-        #                         if state[i] == '1'))
-        #                -(1-2*sum(p for (state, p) in probabilities.items()
-        #                          if state[i] == '0')))/2 for i in range(len(self._reg))]
+        # values are valid for the whole measurement cycle, so repeated
+        # queries (e.g. from var()) are served from the cache
+        cache_key = (observable, device_labels)
+        if cache_key in self._expval_cache:
+            return self._expval_cache[cache_key]
 
+        expval = self._expval_handlers[observable](self, device_labels, par)
+        self._expval_cache[cache_key] = expval
         return expval
 
     def var(self, observable, wires, par):
@@ -636,45 +1018,79 @@ class ProjectQClassicalSimulator(_ProjectQDevice):
 
     short_name = "projectq.classical"
     _operation_map = {
-        key: val for key, val in PROJECTQ_OPERATION_MAP.items() if val in [XGate, CNOT, BasisState]
+        key: val for key, val in PROJECTQ_OPERATION_MAP.items() if val in _CLASSICAL_GATES
     }
     _observable_map = dict(
-        {key: val for key, val in PROJECTQ_OPERATION_MAP.items() if val in [ZGate]},
+        {
+            key: val
+            for key, val in PROJECTQ_OPERATION_MAP.items()
+            if val in _CLASSICAL_OBSERVABLE_GATES
+        },
         **{"Identity": None}
     )
+    _operations_set = frozenset(_operation_map)
+    _observables_set = frozenset(_observable_map)
     _circuits = {}
-    _backend_kwargs = []
+    _backend_kwargs = frozenset()
 
     def __init__(self, wires=1, **kwargs):
         kwargs["backend"] = "ClassicalSimulator"
         super().__init__(wires=wires, shots=None, **kwargs)
 
     def reset(self):
-        """Reset/initialize the device by initializing the backend and engine, and allocating qubits."""
+        """Reset/initialize the device by initializing the backend and engine, and allocating qubits.
+
+        On repeated calls the existing engine and register are kept and the
+        classical bits are simply written back to zero; for this backend the
+        engine construction and qureg allocation dominate the per-circuit
+        cost, since the simulation itself is just bit manipulation.
+        """
+        if self._eng is not None:
+            # flush first so the buffered Allocate commands reach the backend;
+            # writing a bit of a qubit the backend has not seen yet raises
+            self._eng.flush()
+            backend = self._eng.backend
+            for qubit in self._reg:
+                backend.write_bit(qubit, 0)
+            self._first_operation = True
+            self._pending_ops = []
+            self._expval_cache = {}
+            # the register is unchanged, so the cached qubit groupings stay valid
+            return
+
         backend = pq.backends.ClassicalSimulator(**self.filter_kwargs_for_backend(self._kwargs))
-        self._eng = pq.MainEngine(backend, verbose=self._kwargs["verbose"])
+        self._eng = pq.MainEngine(backend, verbose=self._verbose)
         super().reset()
 
     def pre_measure(self):
         """Apply a measure all operation and flush the device before retrieving observable measurements."""
-        pq.ops.All(pq.ops.Measure) | self._reg  # pylint: disable=expression-not-assigned
+        self._apply_pending()
+        _MEASURE_ALL | self._reg  # pylint: disable=expression-not-assigned
         self._eng.flush()
 
-    def expval(self, observable, wires, par):
-        """Retrieve the requested observable expectation values."""
+    def _expval_pauli_z(self, device_labels, par):  # pylint: disable=unused-argument
+        """Read the PauliZ expectation value off the measured classical bit."""
+        return 1 - 2 * int(self._reg[device_labels[0]])
 
-        device_wires = self.map_wires(wires)
+    def _expval_identity(self, device_labels, par):  # pylint: disable=unused-argument
+        """Compute the Identity expectation value."""
+        return 1
 
-        if observable == "PauliZ":
-            wire = device_wires.labels[0]
-            expval = 1 - 2 * int(self._reg[wire])
+    # def _expval_all_pauli_z(self, device_labels, par):
+    #     # todo: enable when multiple return values are supported
+    #     return [1 - 2*int(self._reg[wire]) for wire in self._reg]
 
-        elif observable == "Identity":
-            expval = 1
-        # elif observable == 'AllPauliZ':
-        #     expval = [ 1 - 2*int(self._reg[wire]) for wire in self._reg]
+    # dispatch on the observable name with a single dict lookup instead of a
+    # chain of string comparisons per call, as on the other devices
+    _expval_handlers = {
+        "PauliZ": _expval_pauli_z,
+        "Identity": _expval_identity,
+    }
 
-        return expval
+    def expval(self, observable, wires, par):
+        """Retrieve the requested observable expectation values."""
+        device_labels = self._mapped_labels(wires)
+        return self._expval_handlers[observable](self, device_labels, par)
 
     def var(self, observable, wires, par):
         """Retrieve the requested observable variance."""
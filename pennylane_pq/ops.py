@@ -36,8 +36,24 @@ quantum functions:
 
 """
 
+import numpy as np
 import pennylane.operation as plops
 
+# constant gate matrices, computed once at import time and shared read-only by
+# all instances (S and T map to native ProjectQ gates and need no matrix here)
+_SQRTX_MATRIX = 0.5 * np.array([[1 + 1j, 1 - 1j], [1 - 1j, 1 + 1j]], dtype=np.complex128)
+_SQRTX_MATRIX.setflags(write=False)
+_SQRTSWAP_MATRIX = np.array(
+    [
+        [1, 0, 0, 0],
+        [0, 0.5 + 0.5j, 0.5 - 0.5j, 0],
+        [0, 0.5 - 0.5j, 0.5 + 0.5j, 0],
+        [0, 0, 0, 1],
+    ],
+    dtype=np.complex128,
+)
+_SQRTSWAP_MATRIX.setflags(write=False)
+
 
 class SqrtX(plops.Operation):
     r"""Square root X gate.
@@ -51,6 +67,15 @@ class SqrtX(plops.Operation):
     num_wires = 1
     par_domain = None
 
+    @staticmethod
+    def compute_matrix():  # pylint: disable=arguments-differ
+        return _SQRTX_MATRIX
+
+    # alias for PennyLane versions predating the compute_matrix hook
+    @classmethod
+    def _matrix(cls, *params):
+        return _SQRTX_MATRIX
+
 
 class SqrtSwap(plops.Operation):  # pylint: disable=too-few-public-methods
     r"""Square root SWAP gate.
@@ -65,6 +90,15 @@ class SqrtSwap(plops.Operation):  # pylint: disable=too-few-public-methods
     num_wires = 2
     par_domain = None
 
+    @staticmethod
+    def compute_matrix():  # pylint: disable=arguments-differ
+        return _SQRTSWAP_MATRIX
+
+    # alias for PennyLane versions predating the compute_matrix hook
+    @classmethod
+    def _matrix(cls, *params):
+        return _SQRTSWAP_MATRIX
+
 
 # class Toffoli(Operation): #pylint: disable=too-few-public-methods
 #     r"""Apply the Tofoli gate.
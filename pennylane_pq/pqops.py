@@ -21,17 +21,28 @@ Wrapper classes for ProjectQ Operations
 This module provides wrapper classes for `Operations` that are missing a class in ProjectQ.
 
 """
+import cmath
+import functools
+import math
+import sys
+
 import projectq as pq
 from projectq.ops import BasicGate, SelfInverseGate
 import numpy as np
 
 
+# dtype used for gate matrices handed to ProjectQ; complex64 is sufficient
+# (and halves the matrix memory traffic) when targeting noisy hardware where
+# shot noise dominates numerical precision
+DEFAULT_GATE_DTYPE = np.complex128
+
+
 class BasicProjectQGate(BasicGate):  # pylint: disable=too-few-public-methods
     """Base class for ProjectQ gates."""
 
     def __init__(self, name="unnamed"):
         super().__init__()
-        self.name = name
+        self.name = sys.intern(name)
 
     def __str__(self):
         return self.name
@@ -48,12 +59,26 @@ class BasicProjectQMatrixGate(MatrixGate):  # pylint: disable=too-few-public-met
 
     def __init__(self, name="unnamed"):
         super().__init__()
-        self.name = name
+        self.name = sys.intern(name)
+
+    def __array__(self):
+        return self.matrix
 
     def __str__(self):
         return self.name
 
 
+# the controlled meta-gates are stateless, so a single shared instance can be
+# handed out by the constructors below instead of rebuilding it per call
+_CNOT_GATE = pq.ops.C(pq.ops.XGate())
+_CZ_GATE = pq.ops.C(pq.ops.ZGate())
+_X_GATE = pq.ops.XGate()
+
+_IDENTITY_GATE = BasicProjectQMatrixGate("I")
+_IDENTITY_GATE.matrix = np.eye(2, dtype=DEFAULT_GATE_DTYPE)
+_IDENTITY_GATE.matrix.setflags(write=False)
+
+
 class CNOT(BasicProjectQGate):  # pylint: disable=too-few-public-methods
     """Class for the CNOT gate.
 
@@ -63,8 +88,8 @@ class CNOT(BasicProjectQGate):  # pylint: disable=too-few-public-methods
     a gate with the correct properties by overwriting __new__().
     """
 
-    def __new__(*par):  # pylint: disable=no-method-argument
-        return pq.ops.C(pq.ops.XGate())
+    def __new__(cls):
+        return _CNOT_GATE
 
 
 class CZ(BasicProjectQGate):  # pylint: disable=too-few-public-methods
@@ -76,8 +101,8 @@ class CZ(BasicProjectQGate):  # pylint: disable=too-few-public-methods
     a gate with the correct properties by overwriting __new__().
     """
 
-    def __new__(*par):  # pylint: disable=no-method-argument
-        return pq.ops.C(pq.ops.ZGate())
+    def __new__(cls):
+        return _CZ_GATE
 
 
 # class Toffoli(BasicProjectQGate): # pylint: disable=too-few-public-methods
@@ -103,22 +128,83 @@ class CZ(BasicProjectQGate):  # pylint: disable=too-few-public-methods
 #         return pq.ops.Tensor(pq.ops.ZGate())
 
 
-class Rot(BasicProjectQGate):
+def _rot_matrix(phi, theta, omega):
+    """Matrix of the arbitrary single qubit rotation in ZYZ decomposition.
+
+    Evaluates the closed-form expression of the product
+    Rz(omega) Ry(theta) Rz(phi) with scalar arithmetic, instead of building
+    and multiplying three intermediate rotation matrices.
+
+    Args:
+        phi (float): first rotation angle around the z-axis
+        theta (float): rotation angle around the y-axis
+        omega (float): second rotation angle around the z-axis
+
+    Returns:
+        array: the 2x2 unitary of Rz(omega) Ry(theta) Rz(phi)
+    """
+    cos = math.cos(theta / 2)
+    sin = math.sin(theta / 2)
+    exp_plus = cmath.exp(-0.5j * (phi + omega))
+    exp_minus = cmath.exp(-0.5j * (phi - omega))
+    mat = np.empty((2, 2), dtype=np.complex128)
+    mat[0, 0] = exp_plus * cos
+    mat[0, 1] = -exp_minus.conjugate() * sin
+    mat[1, 0] = exp_minus * sin
+    mat[1, 1] = exp_plus.conjugate() * cos
+    return mat
+
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    _rot_matrix = njit(cache=True)(_rot_matrix)
+
+
+@functools.lru_cache(maxsize=4096)
+def _rot_matrix_cached(phi, theta, omega, dtype=DEFAULT_GATE_DTYPE):
+    """Memoized version of :func:`_rot_matrix`.
+
+    Variational loops evaluate the same angle triples over and over (e.g. for
+    the expectation and the variance of one circuit evaluation), so the
+    matrices are cached on the exact angle values. The cached arrays are
+    shared between gate instances and therefore marked read-only.
+    """
+    mat = _rot_matrix(phi, theta, omega)
+    if dtype is not np.complex128:
+        mat = mat.astype(dtype)
+    mat.setflags(write=False)
+    return mat
+
+
+class Rot(BasicProjectQMatrixGate):
     """Class for the arbitrary single qubit rotation gate.
 
     ProjectQ does not currently have an arbitrary single qubit rotation gate,
-    so we provide a class that return a suitable combination of rotation gates
-    assembled into a single gate from the constructor of this class.
+    so we compute the matrix of the ZYZ decomposition once at construction
+    time and apply it as a single gate, instead of issuing three separate
+    rotation gates on every application.
+
+    Zero-angle rotations, which variational training regularly produces,
+    collapse to a shared identity gate that ProjectQ's local optimizer can
+    drop entirely.
     """
 
+    def __new__(cls, *par):
+        if abs(par[0]) + abs(par[1]) + abs(par[2]) < 1e-15:
+            return _IDENTITY_GATE
+        return super().__new__(cls)
+
     def __init__(self, *par):
-        BasicProjectQGate.__init__(self, name=self.__class__.__name__)
+        BasicProjectQMatrixGate.__init__(self, name=self.__class__.__name__)
         self.angles = par
-
-    def __or__(self, qubits):
-        pq.ops.Rz(self.angles[0]) | qubits  # pylint: disable=expression-not-assigned
-        pq.ops.Ry(self.angles[1]) | qubits  # pylint: disable=expression-not-assigned
-        pq.ops.Rz(self.angles[2]) | qubits  # pylint: disable=expression-not-assigned
+        try:
+            self.matrix = _rot_matrix_cached(*par)
+        except TypeError:  # unhashable array-like angles
+            self.matrix = _rot_matrix_cached(*(float(angle) for angle in par))
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -126,7 +212,7 @@ class Rot(BasicProjectQGate):
         return False
 
 
-class QubitUnitary(BasicProjectQGate):  # pylint: disable=too-few-public-methods
+class QubitUnitary(BasicProjectQMatrixGate):  # pylint: disable=too-few-public-methods
     """Class for the QubitUnitary gate.
 
     ProjectQ does not currently have a real arbitrary QubitUnitary gate,
@@ -135,10 +221,9 @@ class QubitUnitary(BasicProjectQGate):  # pylint: disable=too-few-public-methods
     do this here.
     """
 
-    def __new__(*par):
-        unitary_gate = BasicProjectQMatrixGate(par[0].__name__)
-        unitary_gate.matrix = np.array(par[1])
-        return unitary_gate
+    def __init__(self, matrix):
+        BasicProjectQMatrixGate.__init__(self, name=self.__class__.__name__)
+        self.matrix = np.ascontiguousarray(matrix, dtype=DEFAULT_GATE_DTYPE)
 
 
 class BasisState(BasicProjectQGate, SelfInverseGate):  # pylint: disable=too-few-public-methods
@@ -155,7 +240,7 @@ class BasisState(BasicProjectQGate, SelfInverseGate):  # pylint: disable=too-few
     def __or__(self, qubits):
         for i, qureg in enumerate(qubits):
             if self.basis_state_to_prep[i] == 1:
-                pq.ops.XGate() | qureg  # pylint: disable=expression-not-assigned
+                _X_GATE | qureg  # pylint: disable=expression-not-assigned
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
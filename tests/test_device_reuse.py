@@ -0,0 +1,93 @@
+# Copyright 2018 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for evaluating several circuits on a single :mod:`pennylane_pq` device.
+"""
+
+import unittest
+import logging as log
+from defaults import pennylane as qml, BaseTest
+from pennylane import numpy as np
+from pennylane_pq.devices import ProjectQSimulator, ProjectQClassicalSimulator
+
+log.getLogger('defaults')
+
+
+class SimulatorReuseTest(BaseTest):
+    """test that a single projectq.simulator device can evaluate consecutive circuits.
+    """
+
+    num_subsystems = 2
+
+    def test_two_circuits_on_one_device(self):
+        """Test that the wavefunction is properly reset between evaluations."""
+        if self.args.device != 'simulator' and self.args.device != 'all':
+            return
+        self.logTestName()
+
+        device = ProjectQSimulator(wires=self.num_subsystems, verbose=True)
+
+        @qml.qnode(device)
+        def circuit1():
+            qml.PauliX(wires=[0])
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        @qml.qnode(device)
+        def circuit2():
+            qml.PauliX(wires=[1])
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        self.assertAllAlmostEqual([-1, 1], np.array(circuit1()), delta=self.tol)
+        self.assertAllAlmostEqual([1, -1], np.array(circuit2()), delta=self.tol)
+        self.assertAllAlmostEqual([-1, 1], np.array(circuit1()), delta=self.tol)
+
+
+class ClassicalSimulatorReuseTest(BaseTest):
+    """test that a single projectq.classical device can evaluate consecutive circuits.
+    """
+
+    num_subsystems = 2
+
+    def test_two_circuits_on_one_device(self):
+        """Test that the bits are properly reset between evaluations."""
+        if self.args.device != 'classical' and self.args.device != 'all':
+            return
+        self.logTestName()
+
+        device = ProjectQClassicalSimulator(wires=self.num_subsystems, verbose=True)
+
+        @qml.qnode(device)
+        def circuit1():
+            qml.PauliX(wires=[0])
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        @qml.qnode(device)
+        def circuit2():
+            qml.PauliX(wires=[1])
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        self.assertAllAlmostEqual([-1, 1], np.array(circuit1()), delta=self.tol)
+        self.assertAllAlmostEqual([1, -1], np.array(circuit2()), delta=self.tol)
+        self.assertAllAlmostEqual([-1, 1], np.array(circuit1()), delta=self.tol)
+
+
+if __name__ == '__main__':
+    print('Testing PennyLane ProjectQ Plugin version ' + qml.version() + ', device reuse.')
+    # run the tests in this file
+    suite = unittest.TestSuite()
+    for t in (SimulatorReuseTest, ClassicalSimulatorReuseTest):
+        ttt = unittest.TestLoader().loadTestsFromTestCase(t)
+        suite.addTests(ttt)
+
+    unittest.TextTestRunner().run(suite)
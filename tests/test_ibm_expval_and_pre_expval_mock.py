@@ -72,6 +72,40 @@ class ExpvalAndPreExpvalMock(BaseTest):
             with patch('projectq.ops.All', new_callable=PropertyMock) as mock_All:
                 self.assertRaises(NotImplementedError, dev.pre_measure)
 
+    def test_pre_measure_batches_expvals(self):
+        """Test that pre_measure computes all queued PauliZ expectations in one batch."""
+
+        with patch('pennylane_pq.devices._get_ibm_setup') as mock_setup, \
+             patch('projectq.MainEngine') as mock_main_engine, \
+             patch('pennylane_pq.devices._MEASURE_ALL') as mock_measure_all:
+            mock_setup.return_value.get_engine_list.return_value = []
+            dev = ProjectQIBMBackend(wires=2, use_hardware=False, num_runs=8*1024, token=token, verbose=True)
+            dev._eng.backend.get_probabilities.return_value = {'00': 0.1, '01': 0.3, '10': 0.2, '11': 0.4}
+
+            mock_PauliZ_0 = MagicMock(wires=Wires([0]))
+            mock_PauliZ_0.name = 'PauliZ'
+            mock_PauliZ_1 = MagicMock(wires=Wires([1]))
+            mock_PauliZ_1.name = 'PauliZ'
+            # measurement processes wrapping the observables, as queued by
+            # newer PennyLane versions
+            mock_mp_0 = MagicMock()
+            mock_mp_0.obs = mock_PauliZ_0
+            mock_mp_1 = MagicMock()
+            mock_mp_1.obs = mock_PauliZ_1
+            dev._obs_queue = [mock_mp_0, mock_mp_1]
+
+            dev.pre_measure()
+
+            self.assertAlmostEqual(dev._expval_cache[('PauliZ', (0,))], -0.2, delta=self.tol)
+            self.assertAlmostEqual(dev._expval_cache[('PauliZ', (1,))], -0.4, delta=self.tol)
+
+            # the batched values must be served from the cache without
+            # further queries to the backend
+            dev._eng.backend.get_probabilities.assert_called_once()
+            self.assertAlmostEqual(dev.expval('PauliZ', wires=Wires([0]), par=list()), -0.2, delta=self.tol)
+            self.assertAlmostEqual(dev.expval('PauliZ', wires=Wires([1]), par=list()), -0.4, delta=self.tol)
+            dev._eng.backend.get_probabilities.assert_called_once()
+
     def test_expval(self):
 
         dev = ProjectQIBMBackend(wires=2, use_hardware=False, num_runs=8*1024, token=token, verbose=True)
@@ -0,0 +1,71 @@
+# Copyright 2018 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the shot-noise sampling of the :mod:`pennylane_pq` simulator device.
+"""
+
+import unittest
+import logging as log
+from defaults import pennylane as qml, BaseTest
+from pennylane import numpy as np
+from pennylane_pq.devices import ProjectQSimulator
+
+log.getLogger('defaults')
+
+
+class ShotSamplingTest(BaseTest):
+    """test the sampled expectation values of the simulator device.
+    """
+
+    def test_large_shots_sampling_statistics(self):
+        """Test that sampled expectation values for large shot counts (where the
+        binomial sampling is approximated by a Gaussian) have the mean and
+        variance of the underlying binomial distribution."""
+        if self.args.device != 'simulator' and self.args.device != 'all':
+            return
+        self.logTestName()
+
+        shots = 100000
+        num_evaluations = 200
+        theta = 0.6
+        device = ProjectQSimulator(wires=1, shots=shots, rnd_seed=42, verbose=True)
+
+        @qml.qnode(device)
+        def circuit():
+            qml.RX(theta, wires=[0])
+            return qml.expval(qml.PauliZ(0))
+
+        samples = np.array([circuit() for _ in range(num_evaluations)])
+
+        p0 = (1 + np.cos(theta)) / 2
+        expected_mean = np.cos(theta)
+        expected_variance = 4 * p0 * (1 - p0) / shots
+
+        # the seeded rng makes these deterministic; the tolerances correspond
+        # to a few standard deviations of the respective estimators
+        self.assertAlmostEqual(np.mean(samples), expected_mean,
+                               delta=5 * np.sqrt(expected_variance / num_evaluations))
+        self.assertAlmostEqual(np.var(samples), expected_variance,
+                               delta=0.3 * expected_variance)
+
+
+if __name__ == '__main__':
+    print('Testing PennyLane ProjectQ Plugin version ' + qml.version() + ', shot sampling.')
+    # run the tests in this file
+    suite = unittest.TestSuite()
+    for t in (ShotSamplingTest, ):
+        ttt = unittest.TestLoader().loadTestsFromTestCase(t)
+        suite.addTests(ttt)
+
+    unittest.TextTestRunner().run(suite)